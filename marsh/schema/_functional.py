@@ -1,4 +1,5 @@
 from typing import (
+    Any,
     Callable,
     Optional,
     Type,
@@ -26,6 +27,7 @@ def register(
     lower_priority: _RelativePriority = None,
     higher_priority: _RelativePriority = None,
     replace: bool = False,
+    origin: Any = marsh.MISSING,
 ) -> Type[_S]:
     ...
 
@@ -37,6 +39,7 @@ def register(
     lower_priority: _RelativePriority = None,
     higher_priority: _RelativePriority = None,
     replace: bool = False,
+    origin: Any = marsh.MISSING,
 ) -> Callable[[Type[_S]], Type[_S]]:
     ...
 
@@ -49,6 +52,7 @@ def register(
     lower_priority: _RelativePriority = None,
     higher_priority: _RelativePriority = None,
     replace: bool = False,
+    origin: Any = marsh.MISSING,
 ) -> Union[Callable[[Type[_S]], Type[_S]], Type[_S]]:
     """Register a new schema (decorator).
 
@@ -67,6 +71,10 @@ def register(
             have higher priority compared to the new schema.
         replace: Allow replacing existing registered schema
             with same name.
+        origin: If given, the schema is only matched against values
+            where :func:`typing.get_origin` returns this origin. Allows
+            the schema to be skipped for other values without calling
+            its ``match()`` method.
 
     Returns:
         Decorator if ``schema`` was not given, else ``schema``.
@@ -80,6 +88,7 @@ def register(
             lower_priority=lower_priority,
             higher_priority=higher_priority,
             replace=replace,
+            origin=origin,
         )
         return schema
     if schema is None:
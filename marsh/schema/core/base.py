@@ -1,6 +1,7 @@
 from typing import (
     Any,
     Callable,
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -9,9 +10,11 @@ from typing import (
     Optional,
     Sequence,
     SupportsIndex,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    get_origin,
     overload,
     cast,
 )
@@ -95,12 +98,19 @@ class SchemaRegistry(Generic[_S]):
 
     priority: marsh.utils.PriorityOrder[Type[_S]]
 
+    origins: Dict[Type[_S], Any]
+    """The origin (see :func:`typing.get_origin`) that a value must
+    have for a schema to match it. Schemas without an origin are
+    matched against all values."""
+
     def __init__(
         self,
         error: Type[Exception] = marsh.errors.MarshError,
     ) -> None:
         self.priority = marsh.utils.PriorityOrder()
+        self.origins = {}
         self.error = error
+        self._candidates: Dict[Any, Tuple[Type[_S], ...]] = {}
 
     def __iter__(
         self,
@@ -116,6 +126,7 @@ class SchemaRegistry(Generic[_S]):
         lower_priority: marsh.utils.PriorityOrder.RelativePriority[Type[_S]] = None,
         higher_priority: marsh.utils.PriorityOrder.RelativePriority[Type[_S]] = None,
         replace: bool = False,
+        origin: Any = marsh.MISSING,
     ) -> Type[_S]:
         ...
 
@@ -127,6 +138,7 @@ class SchemaRegistry(Generic[_S]):
         lower_priority: marsh.utils.PriorityOrder.RelativePriority[Type[_S]] = None,
         higher_priority: marsh.utils.PriorityOrder.RelativePriority[Type[_S]] = None,
         replace: bool = False,
+        origin: Any = marsh.MISSING,
     ) -> Callable[[Type[_S]], Type[_S]]:
         ...
 
@@ -138,21 +150,63 @@ class SchemaRegistry(Generic[_S]):
         lower_priority: marsh.utils.PriorityOrder.RelativePriority[Type[_S]] = None,
         higher_priority: marsh.utils.PriorityOrder.RelativePriority[Type[_S]] = None,
         replace: bool = False,
+        origin: Any = marsh.MISSING,
     ) -> Union[Callable[[Type[_S]], Type[_S]], Type[_S]]:
-        if schema is not None:
-            return self.priority.add(
-                schema,
+        def wrapper(_schema):
+            self.priority.add(
+                _schema,
                 priority=priority,
                 lower_priority=lower_priority,
                 higher_priority=higher_priority,
                 replace=replace,
             )
-        return self.priority.add(
-            priority=priority,
-            lower_priority=lower_priority,
-            higher_priority=higher_priority,
-            replace=replace,
+            self._set_origin(_schema, origin)
+            return _schema
+        if schema is None:
+            return wrapper
+        return wrapper(schema)
+
+    def _set_origin(
+        self,
+        schema: Type[_S],
+        origin: Any,
+    ) -> None:
+        self._candidates.clear()
+        # also drops the key of any replaced schema that compares equal
+        self.origins.pop(schema, None)
+        if not marsh.utils.is_missing(origin):
+            self.origins[schema] = origin
+
+    def candidates(
+        self,
+        value: Any,
+    ) -> Sequence[Type[_S]]:
+        """Get the schema types that may match a value, in priority order.
+
+        Schema types registered with an origin are only included
+        when the origin of the value is the same.
+
+        The candidates are cached per origin and the cache is reset
+        by :meth:`register`. Modifying :attr:`priority` directly
+        leaves the cache stale.
+
+        Arguments:
+            value: Value to find candidate schema types for.
+
+        Returns:
+            The candidate schema types.
+        """
+        origin = get_origin(value)
+        try:
+            return self._candidates[origin]
+        except KeyError:
+            pass
+        candidates = self._candidates[origin] = tuple(
+            schema
+            for schema in self.priority
+            if self.origins.get(schema, origin) is origin
         )
+        return candidates
 
     def match(
         self,
@@ -174,7 +228,7 @@ class SchemaRegistry(Generic[_S]):
             Selection of schema types.
         """
         schemas: SchemaSelection[_S] = SchemaSelection()
-        for schema in self.priority:
+        for schema in self.candidates(value):
             try:
                 if schema.match(value):
                     schemas.append(schema)
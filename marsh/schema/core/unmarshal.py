@@ -127,6 +127,7 @@ class UnmarshalSchemaRegistry(base.SchemaRegistry['UnmarshalSchema']):
         lower_priority: _RelativePriority = None,
         higher_priority: _RelativePriority = None,
         replace: bool = False,
+        origin: Any = marsh.MISSING,
     ) -> Type['UnmarshalSchema']:
         ...
 
@@ -138,6 +139,7 @@ class UnmarshalSchemaRegistry(base.SchemaRegistry['UnmarshalSchema']):
         lower_priority: _RelativePriority = None,
         higher_priority: _RelativePriority = None,
         replace: bool = False,
+        origin: Any = marsh.MISSING,
     ) -> Callable[[Type['UnmarshalSchema']], Type['UnmarshalSchema']]:
         ...
 
@@ -149,6 +151,7 @@ class UnmarshalSchemaRegistry(base.SchemaRegistry['UnmarshalSchema']):
         lower_priority: _RelativePriority = None,
         higher_priority: _RelativePriority = None,
         replace: bool = False,
+        origin: Any = marsh.MISSING,
     ) -> Union[
         Callable[
             [Type['UnmarshalSchema']],
@@ -158,13 +161,15 @@ class UnmarshalSchemaRegistry(base.SchemaRegistry['UnmarshalSchema']):
     ]:
         def wrapper(_schema):
             self.cache_clear()
-            return self.priority.add(
+            self.priority.add(
                 _schema,
                 priority=priority,
                 lower_priority=lower_priority,
                 higher_priority=higher_priority,
                 replace=replace,
             )
+            self._set_origin(_schema, origin)
+            return _schema
         if schema is None:
             return wrapper
         return wrapper(schema)
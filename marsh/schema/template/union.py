@@ -52,6 +52,27 @@ class UnionUnmarshalSchema(UnmarshalSchema[_T]):
     ) -> str:
         return ' | '.join(schema.doc_field_type() for schema in self.schemas)
 
+    def rejects(
+        self,
+        schema: UnmarshalSchema,
+        element: marsh.element.ElementType,
+    ) -> bool:
+        """Cheaply determine if one of the schemas in the union
+        is certain to fail unmarshaling an element.
+
+        Rejected schemas are skipped without attempting to
+        unmarshal the element, avoiding the cost of raising
+        and catching an error.
+
+        Arguments:
+            schema: One of the schemas in :attr:`schemas`.
+            element: The element to unmarshal.
+
+        Returns:
+            ``True`` if the schema can be skipped, else ``False``.
+        """
+        return False
+
     def select(
         self,
         path: str,
@@ -75,6 +96,11 @@ class UnionUnmarshalSchema(UnmarshalSchema[_T]):
                 return self.get_default()
         schema = self.optional_schema
         if schema is not None:
+            if (
+                (element is None or marsh.utils.is_missing(element))
+                and self.rejects(schema, element)
+            ):
+                return None  # type: ignore
             try:
                 return schema.unmarshal(element)
             except Exception:
@@ -85,6 +111,8 @@ class UnionUnmarshalSchema(UnmarshalSchema[_T]):
                     return None  # type: ignore
                 raise
         for schema in self.schemas:
+            if self.rejects(schema, element):
+                continue
             try:
                 return schema.unmarshal(element)
             except Exception:
@@ -18,6 +18,9 @@ _T = TypeVar('_T')
 
 _FIELDS = getattr(dataclasses, '_FIELDS', '__dataclass_fields__')
 _INITVAR_SENTINEL = dataclasses._FIELD_INITVAR  # type: ignore
+_GENERATED_DOCSTRING_PATTERN = re.compile(
+    r'^[a-zA-Z0-9_]+\(([a-zA-Z0-9_]+: .+( = .+)?)*\)$',
+)
 
 
 def get_init_var_fields(
@@ -38,12 +41,7 @@ def is_generated_class_docstring(
     docstring: Optional[str],
 ) -> bool:
     if docstring:
-        return bool(
-            re.match(
-                r'^[a-zA-Z0-9_]+\(([a-zA-Z0-9_]+: .+( = .+)?)*\)$',
-                docstring,
-            ),
-        )
+        return bool(_GENERATED_DOCSTRING_PATTERN.match(docstring))
     return False
 
 
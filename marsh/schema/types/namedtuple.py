@@ -16,12 +16,14 @@ from . import (
 
 _T = TypeVar('_T', bound=marsh.utils.NamedTupleProtocol)
 
+_GENERATED_DOCSTRING_PATTERN = re.compile(r'^[a-zA-Z0-9_]+\(([a-zA-Z0-9_]+,)*\)$')
+
 
 def is_generated_class_docstring(
     docstring: Optional[str],
 ) -> bool:
     if docstring:
-        return bool(re.match(r'^[a-zA-Z0-9_]+\(([a-zA-Z0-9_]+,)*\)$', docstring))
+        return bool(_GENERATED_DOCSTRING_PATTERN.match(docstring))
     return False
 
 
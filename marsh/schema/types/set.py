@@ -27,13 +27,13 @@ class SetUnmarshalSchema(sequence.SequenceUnmarshalSchema):
         cls,
         value: Any,
     ) -> bool:
-        try:
-            return (
-                get_origin(value) is set
-                or issubclass(value, set)
+        return (
+            get_origin(value) is set
+            or (
+                isinstance(value, type)
+                and issubclass(value, set)
             )
-        except Exception:
-            return False
+        )
 
     @staticmethod
     def doc_static_type() -> str:
@@ -1,8 +1,6 @@
 import re
 from typing import (
     Any,
-    Dict,
-    Literal,
     Optional,
     Tuple,
 )
@@ -15,6 +13,9 @@ slice_pattern = re.compile(
 )
 
 
+_SLICE_KEYS = ('start', 'stop', 'step')
+
+
 @marsh.schema.register
 class SliceMarshalSchema(marsh.schema.MarshalSchema):
 
@@ -23,10 +24,7 @@ class SliceMarshalSchema(marsh.schema.MarshalSchema):
         cls,
         value: Any,
     ) -> bool:
-        try:
-            return isinstance(value, slice)
-        except Exception:
-            return False
+        return isinstance(value, slice)
 
     @staticmethod
     def doc_static_type() -> str:
@@ -57,10 +55,7 @@ class SliceUnmarshalSchema(marsh.schema.UnmarshalSchema[slice]):
         cls,
         value: Any,
     ) -> bool:
-        try:
-            return value is slice
-        except Exception:
-            return False
+        return value is slice
 
     @staticmethod
     def doc_static_type() -> str:
@@ -84,6 +79,25 @@ class SliceUnmarshalSchema(marsh.schema.UnmarshalSchema[slice]):
     def doc_description(self) -> Optional[str]:
         return self.doc_static_description()
 
+    def _unmarshal_index(
+        self,
+        element: marsh.element.ElementType,
+        field: Any,
+    ) -> Optional[int]:
+        if element is None or marsh.utils.is_missing(element):
+            return None
+        try:
+            if not marsh.utils.is_primitive(element):
+                raise ValueError
+            return marsh.utils.cast_primitive(int, element)
+        except ValueError:
+            raise marsh.errors.UnmarshalError(
+                'expected an optional integer',
+                path=str(field),
+                element=element,
+                type=self.value,
+            ) from None
+
     def unmarshal(
         self,
         element: marsh.element.ElementType,
@@ -91,21 +105,36 @@ class SliceUnmarshalSchema(marsh.schema.UnmarshalSchema[slice]):
         if marsh.utils.is_missing(element):
             if self.has_default():
                 return self.get_default()
-            element = ()
+            return slice(None)
+        if element == ():
+            return slice(None)
         args: Tuple[Optional[int], ...]
         if marsh.utils.is_mapping(element):
-            kwargs: Dict[str, Optional[int]] = marsh.cast(
-                Dict[Literal['start', 'stop', 'step'], Optional[int]],  # type: ignore
-                element,
+            for key in element:
+                if key not in _SLICE_KEYS:
+                    raise marsh.errors.UnmarshalError(
+                        marsh.utils.get_closest_error_message(
+                            str(key),
+                            _SLICE_KEYS,
+                            key='key',
+                        ),
+                        element=element,
+                        type=self.value,
+                    )
+            args = tuple(
+                self._unmarshal_index(element.get(key, None), key)
+                for key in _SLICE_KEYS
             )
-            args = tuple(kwargs.get(key, None) for key in ('start', 'stop', 'step'))
         elif marsh.utils.is_sequence(element):
-            args = marsh.cast(Tuple[Optional[int], ...], element)  # type: ignore
-            if len(args) > 3:
+            if len(element) > 3:
                 raise marsh.errors.UnmarshalError(
                     f'at most 3 optional integers may be used to construct a '
                     f'slice. Got {len(element)} values',
                 )
+            args = tuple(
+                self._unmarshal_index(index, i)
+                for i, index in enumerate(element)
+            )
         else:
             element = str(element)
             if not slice_pattern.match(element):
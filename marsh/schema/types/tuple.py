@@ -1,5 +1,9 @@
+import functools
 from typing import (
     Any,
+    Mapping,
+    Optional,
+    Sequence,
     get_args,
 )
 
@@ -7,7 +11,10 @@ import marsh
 from . import sequence
 
 
-@marsh.schema.register(lower_priority=sequence.SequenceUnmarshalSchema)
+@marsh.schema.register(
+    lower_priority=sequence.SequenceUnmarshalSchema,
+    origin=tuple,
+)
 class TupleUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[tuple]):
 
     def __init__(
@@ -23,6 +30,7 @@ class TupleUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[tuple
                 if arg != ()  # empty tuple type
             )
         }
+        self._ordered_schemas = tuple(self.schemas.values())
 
     @classmethod
     def match(
@@ -43,7 +51,8 @@ class TupleUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[tuple
             'number of elements as the tuple type specifies.'
         )
 
-    def doc_field_type(
+    @functools.cached_property
+    def _doc_field_type(
         self,
     ) -> str:
         content = ', '.join(
@@ -53,6 +62,38 @@ class TupleUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[tuple
         )
         return f'[{content}]'
 
+    def doc_field_type(
+        self,
+    ) -> str:
+        return self._doc_field_type
+
+    def unmarshal(
+        self,
+        element: marsh.element.ElementType,
+        default_args: Optional[Sequence] = None,
+        default_kwargs: Optional[Mapping[str, Any]] = None,
+    ) -> tuple:
+        # Fast path for the common case of a sequence with
+        # exactly one element per field and no defaults.
+        # Anything else is handled (and reported) by the
+        # generic structured unmarshal.
+        if (
+            not default_args
+            and not default_kwargs
+            and marsh.utils.is_sequence(element)
+            and len(element) == len(self._ordered_schemas)
+        ):
+            values = []
+            for i, (schema, item) in enumerate(zip(self._ordered_schemas, element)):
+                with marsh.errors.prepend(i):
+                    values.append(schema.unmarshal(item))
+            return tuple(values)
+        return super().unmarshal(
+            element,
+            default_args=default_args,
+            default_kwargs=default_kwargs,
+        )
+
     def construct(
         self,
         *args,
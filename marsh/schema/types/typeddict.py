@@ -22,6 +22,9 @@ class _Sentinel:
         return ''
 
 
+_SENTINEL = _Sentinel()
+
+
 @marsh.schema.register(lower_priority=mapping.MappingUnmarshalSchema)
 class TypedDictUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[_T]):
 
@@ -29,27 +32,21 @@ class TypedDictUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[_
     def required_keys(
         self,
     ) -> Sequence[str]:
+        ordered_keys = tuple(get_type_hints(self.value))
         if hasattr(self.value, '__required_keys__'):
             keys = self.value.__required_keys__  # type: ignore
-        elif self.value.__total__:  # type: ignore
-            keys = frozenset(get_type_hints(self.value))
-        else:
-            keys = frozenset()
-        ordered_keys = tuple(get_type_hints(self.value))
-        return sorted(keys, key=lambda x: ordered_keys.index(x))
+            return tuple(key for key in ordered_keys if key in keys)
+        return ordered_keys if self.value.__total__ else ()  # type: ignore
 
     @functools.cached_property
     def optional_keys(
         self,
     ) -> Sequence[str]:
+        ordered_keys = tuple(get_type_hints(self.value))
         if hasattr(self.value, '__optional_keys__'):
             keys = self.value.__optional_keys__  # type: ignore
-        elif not self.value.__total__:  # type: ignore
-            keys = frozenset(get_type_hints(self.value))
-        else:
-            keys = frozenset()
-        ordered_keys = tuple(get_type_hints(self.value))
-        return sorted(keys, key=lambda x: ordered_keys.index(x))
+            return tuple(key for key in ordered_keys if key in keys)
+        return () if self.value.__total__ else ordered_keys  # type: ignore
 
     def __init__(
         self,
@@ -57,7 +54,6 @@ class TypedDictUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[_
         **kwargs,
     ) -> None:
         super().__init__(*args, **kwargs)
-        self._sentinel = _Sentinel()
         annotations = get_type_hints(self.value)
         self.schemas = types.MappingProxyType(
             {
@@ -70,12 +66,17 @@ class TypedDictUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[_
                 **{
                     name: marsh.schema.UnmarshalSchema(
                         annotations[name],
-                        default=self._sentinel,
+                        default=_SENTINEL,
                     )
                     for name in self.optional_keys
                 },
             },
         )
+        # (key, required) pairs in construction order
+        self._field_plan = tuple(
+            [(key, True) for key in self.required_keys]
+            + [(key, False) for key in self.optional_keys],
+        )
 
     @classmethod
     def match(
@@ -93,7 +94,9 @@ class TypedDictUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[_
         return (
             'Unmarshals any subclass of :class:`~typing.TypedDict` '
             'from a mapping input. If ``total=False`` then '
-            'all keys are optional.'
+            'all keys are optional. A sequence input is matched '
+            'positionally against all required keys followed by '
+            'all optional keys, each in declaration order.'
         )
 
     def construct(
@@ -101,20 +104,18 @@ class TypedDictUnmarshalSchema(marsh.schema.template.StructuredUnmarshalSchema[_
         *args,
         **kwargs,
     ) -> _T:
-        if args and not kwargs:
-            kwargs = {
-                key: value
-                for key, value
-                in zip(get_type_hints(self.value), args)
-            }
-            args = ()
-        mapping = dict(*args, **kwargs)
-        for key, value in tuple(mapping.items()):
-            if value is self._sentinel:
-                if key in self.optional_keys:
-                    del mapping[key]
-                else:
+        # positional arguments follow the order of the schemas
+        mapping = dict(zip(self.schemas, args)) if args else kwargs
+        if args and kwargs:
+            mapping.update(kwargs)
+        result = {}
+        for key, required in self._field_plan:
+            value = mapping.get(key, _SENTINEL)
+            if value is _SENTINEL:
+                if required:
                     raise marsh.errors.MissingValueError(
                         f'required key: {key}',
                     )
-        return mapping  # type: ignore
+                continue
+            result[key] = value
+        return result  # type: ignore
@@ -11,6 +11,19 @@ from typing import (
 import marsh
 
 
+@marsh.schema.caches.new_callable_cache(
+    name='marsh.schema.types.typevar.resolve_type',
+)
+def resolve_type(
+    value: TypeVar,
+) -> Any:
+    if value.__constraints__:
+        if len(value.__constraints__) == 1:
+            return value.__constraints__[0]
+        return Union[value.__constraints__]  # pyright: ignore
+    return value.__bound__
+
+
 @marsh.schema.register
 class TypeVarUnmarshalSchema(marsh.schema.UnmarshalSchema[Any]):
 
@@ -45,16 +58,13 @@ class TypeVarUnmarshalSchema(marsh.schema.UnmarshalSchema[Any]):
         cls,
         value: Any,
     ) -> bool:
-        try:
-            return bool(
-                isinstance(value, TypeVar)
-                and (
-                    value.__bound__ is not None
-                    or value.__constraints__
-                ),
-            )
-        except Exception:
-            return False
+        return bool(
+            isinstance(value, TypeVar)
+            and (
+                value.__bound__ is not None
+                or value.__constraints__
+            ),
+        )
 
     @staticmethod
     def doc_static_type() -> str:
@@ -72,11 +82,7 @@ class TypeVarUnmarshalSchema(marsh.schema.UnmarshalSchema[Any]):
     def resolve_type(
         self,
     ) -> Any:
-        if self.value.__constraints__:
-            if len(self.value.__constraints__) == 1:
-                return self.value.__constraints__[0]
-            return Union[self.value.__constraints__]  # pyright: ignore
-        return self.value.__bound__
+        return resolve_type(self.value)
 
     def select(
         self,
@@ -1,5 +1,8 @@
 from typing import (
     Any,
+    Callable,
+    Dict,
+    Type,
     TypeVar,
     Union,
     get_args,
@@ -7,12 +10,28 @@ from typing import (
 )
 
 import marsh
+from . import (
+    none,
+    primitive,
+)
 
 
 _T = TypeVar('_T')
 
 
-@marsh.schema.register
+# Predicates for schemas that cheaply can tell if an element
+# may be unmarshaled. Keyed by exact schema type as subclasses
+# are free to accept other elements.
+_FAST_CHECKS: Dict[Type[marsh.schema.UnmarshalSchema], Callable[[Any], bool]] = {
+    primitive.PrimitiveUnmarshalSchema: marsh.utils.is_primitive,
+    none.NoneUnmarshalSchema: lambda element: (
+        element is None
+        or marsh.utils.is_missing(element)
+    ),
+}
+
+
+@marsh.schema.register(origin=Union)
 class UnionUnmarshalSchema(marsh.schema.template.UnionUnmarshalSchema[_T]):
     """Attempts to unmarshal the types in a union one at a time in the order
     of the types held by the Union type alias."""
@@ -24,10 +43,8 @@ class UnionUnmarshalSchema(marsh.schema.template.UnionUnmarshalSchema[_T]):
     ) -> None:
         super().__init__(*args, **kwargs)
         self.schemas = tuple(
-            map(
-                marsh.schema.UnmarshalSchema,
-                get_args(self.value),
-            ),
+            marsh.schema.UnmarshalSchema(type_)
+            for type_ in get_args(self.value)
         )
 
     @classmethod
@@ -44,6 +61,14 @@ class UnionUnmarshalSchema(marsh.schema.template.UnionUnmarshalSchema[_T]):
     def doc_static_type() -> str:
         return ':data:`~typing.Union`'
 
+    def rejects(
+        self,
+        schema: marsh.schema.UnmarshalSchema,
+        element: marsh.element.ElementType,
+    ) -> bool:
+        check = _FAST_CHECKS.get(type(schema))
+        return check is not None and not check(element)
+
     @staticmethod
     def doc_static_description() -> str:
         return (
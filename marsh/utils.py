@@ -6,6 +6,7 @@ import dataclasses
 import difflib
 import functools
 import inspect
+import itertools
 import os
 import shutil
 import sys
@@ -71,9 +72,16 @@ for module in (typing, typing_extensions):
         ('is_typeddict', _IsTypedDict),
     ):
         try:
-            container.append(getattr(module, attr))
+            member = getattr(module, attr)
         except Exception:
-            pass
+            continue
+        # typing_extensions re-exports members of typing when
+        # available, only keep one of them to keep lookups short.
+        if not any(member is existing for existing in container):
+            container.append(member)
+
+
+_PROTOCOL_TYPES: Final = frozenset(_ProtocolTypes)
 
 
 # used by python 3.8 to determine when a typing alias
@@ -201,30 +209,71 @@ class NamedTupleProtocol(Protocol):
         ...
 
 
+_NOT_FOUND: Final = object()
+
+
+# members of the runtime checkable protocols in this module,
+# all of which are methods
+_PROTOCOL_MEMBERS: Final = {
+    SequenceProtocol: ('__contains__', '__getitem__', '__len__'),
+    MappingProtocol: (
+        '__contains__',
+        '__getitem__',
+        '__iter__',
+        'get',
+        'items',
+        'keys',
+        'values',
+    ),
+}
+
+
+# python 3.12+ looks up protocol members with inspect.getattr_static,
+# which the getattr based fast path would not agree with
+_PROTOCOL_FAST_PATH: Final = sys.version_info < (3, 12)
+
+
+def _implements(
+    value: Any,
+    protocol: Any,
+) -> bool:
+    """Equivalent of ``isinstance(value, protocol)`` for the
+    runtime checkable protocols in this module.
+
+    Before python 3.12 the members are checked directly and
+    :func:`isinstance` is only used when they are not all present,
+    which covers nominal and registered subclasses."""
+    if not _PROTOCOL_FAST_PATH:
+        return isinstance(value, protocol)
+    for attr in _PROTOCOL_MEMBERS[protocol]:
+        if getattr(value, attr, None) is None:
+            return isinstance(value, protocol)
+    return True
+
+
 class SingletonMeta(type):
     """Converts a class into a singleton.
 
     When the constructor of the class is called
     the first time, an instance is constructed.
     After this, the constructor will always return
-    that instance unless it is garbage collected.
+    that instance.
 
-    To allow for garbage collection of unused instances
-    a weak reference is kept of the instance.
+    The instance is stored on the class itself so
+    that it is garbage collected together with the class.
     """
 
-    _instances: MutableMapping[Type[Any], Any] = \
-        weakref.WeakKeyDictionary()
-
     def __call__(
         cls,
         *args,
         **kwargs,
-    ) -> None:
-        meta = type(cls)
-        if cls not in meta._instances:
-            meta._instances[cls] = super().__call__(*args, **kwargs)
-        return meta._instances[cls]
+    ) -> Any:
+        # look in the class dict only, subclasses get their own instance
+        instance = cls.__dict__.get('_singleton_instance', _NOT_FOUND)
+        if instance is _NOT_FOUND:
+            instance = super().__call__(*args, **kwargs)
+            cls._singleton_instance = instance
+        return instance
 
 
 class _CacheInfoInputType(Protocol):
@@ -358,10 +407,10 @@ def cache(
 
     .. note::
 
-        The bypass is triggered for :class:`TypeError`.
-        If the function itself can raise this error it
-        will be called twice before the final error is
-        propagated.
+        The bypass is triggered for :class:`TypeError`
+        when the arguments can not be hashed. If the
+        function itself raises this error for hashable
+        arguments it is propagated without a second call.
 
     The wrapped function fulfills the :class:`CacheType`
     protocol.
@@ -374,7 +423,7 @@ def cache(
             of values that produce the same hash.
         safe: Make a second attempt at calling the function
             and bypassing the cache if the first attempt fails
-            with a :class:`TypeError`.
+            with a :class:`TypeError` due to unhashable arguments.
         binding: Should only be used when a method to a class
             is decorated with this function. ``'weak'`` will
             make sure that a weak reference to
@@ -391,39 +440,31 @@ def cache(
     def wrapper(func: Callable[..., _T]):
 
         cached_func: Callable[..., _T]
+        enabled_func: Callable[..., _T]
         delegating_func: Callable[..., _T]
-        disabled = False
-
-        def cache_disable() -> None:
-            nonlocal disabled
-            disabled = True
-
-        def cache_enable() -> None:
-            nonlocal disabled
-            disabled = False
 
         if binding == 'ignore':
             _self: Any = None
 
+            @functools.lru_cache(maxsize=maxsize, typed=typed)
             def cached_func(
                 *args,
                 **kwargs,
             ) -> _T:
                 return func(_self, *args, **kwargs)
 
-            def delegating_func(
+            def enabled_func(
                 self,
                 *args,
                 **kwargs,
             ) -> _T:
-                if disabled:
-                    return func(self, *args, **kwargs)
                 nonlocal _self
                 _self = self
                 return cached_func(*args, **kwargs)
 
         elif binding == 'weak':
 
+            @functools.lru_cache(maxsize=maxsize, typed=typed)
             def cached_func(
                 self: weakref.ReferenceType,
                 *args,
@@ -431,40 +472,63 @@ def cache(
             ) -> _T:
                 return func(self(), *args, **kwargs)
 
-            def delegating_func(
+            # weakref.ref() returns the existing reference to an
+            # object if there is one, so no new reference is
+            # allocated after the first call for the same object.
+            ref = weakref.ref
+
+            def enabled_func(
                 self,
                 *args,
                 **kwargs,
             ) -> _T:
-                if disabled:
-                    return func(self, *args, **kwargs)
-                return cached_func(weakref.ref(self), *args, **kwargs)
+                return cached_func(ref(self), *args, **kwargs)
 
         elif binding is None:
-            cached_func = func
-
-            def delegating_func(
-                *args,
-                **kwargs,
-            ) -> _T:
-                if disabled:
-                    return func(*args, **kwargs)
-                return cached_func(*args, **kwargs)
+            cached_func = enabled_func = functools.lru_cache(
+                maxsize=maxsize,
+                typed=typed,
+            )(func)
 
         else:
             raise ValueError(f'unexpected `binding` value: {binding}')
-        cached_func = functools.lru_cache(maxsize=maxsize, typed=typed)(cached_func)
+
+        # the function being called is swapped out when
+        # the cache is disabled instead of checking a flag
+        # on every call
+        active_func = [enabled_func]
+
+        def cache_disable() -> None:
+            active_func[0] = func
+
+        def cache_enable() -> None:
+            active_func[0] = enabled_func
+
         if safe:
-            unsafe_delegating_func = delegating_func
 
             def delegating_func(*args, **kwargs):
                 try:
-                    return unsafe_delegating_func(*args, **kwargs)
+                    return active_func[0](*args, **kwargs)
                 except TypeError:
-                    return func(*args, **kwargs)
+                    # only bypass the cache if the error came from
+                    # hashing the arguments, not from the function
+                    try:
+                        if binding == 'ignore':
+                            make_hash_key(*args[1:], **kwargs)
+                        elif binding == 'weak':
+                            make_hash_key(weakref.ref(args[0]), *args[1:], **kwargs)
+                        else:
+                            make_hash_key(*args, **kwargs)
+                    except TypeError:
+                        return func(*args, **kwargs)
+                    raise
+
+        else:
+
+            def delegating_func(*args, **kwargs):
+                return active_func[0](*args, **kwargs)
 
         wrapped_func = functools.wraps(func)(delegating_func)
-        wrapped_func.__wrapped__ = func  # type: ignore
         wrapped_func.cache_clear = cached_func.cache_clear  # type: ignore
         wrapped_func.cache_info = cached_func.cache_info  # type: ignore
         wrapped_func.cache_disable = cache_disable  # type: ignore
@@ -475,31 +539,33 @@ def cache(
     return wrapper(fn)
 
 
-class _CachedHashKey(list):
-    """Caches the hash value of an item.
+class _CachedHashKey(tuple):
+    """Caches the hash value of a tuple.
 
     An instance of this class will always
     return this value from ``__hash__``
     without a new hash lookup.
 
+    The hash is stored as the last item since
+    tuple subclasses can not declare slots.
+
     Arguments:
-        value: Hashable value.
+        value: Hashable tuple.
     """
 
-    __slots__ = '_hash'
+    __slots__ = ()
 
-    def __init__(
-        self,
-        value,
+    def __new__(
+        cls,
+        value: tuple,
     ):
-        self._hash = hash(value)
+        return super().__new__(cls, (*value, hash(value)))  # type: ignore
 
     def __hash__(self):
-        return self._hash
+        return self[-1]
 
 
 _HASH_KEY_KEYWORD_MARK: Final = (object(),)
-_HASH_KEY_FAST_HASH_TYPES: Final = {int, str}
 
 
 def make_hash_key(
@@ -513,14 +579,21 @@ def make_hash_key(
     Returns:
         Hashable object that caches its hash, only caclulating it once.
     """
-    key = args
-    if kwargs:
-        key += _HASH_KEY_KEYWORD_MARK
-        for item in kwargs.items():
-            key += item
-    if len(key) == 1 and key[0] in _HASH_KEY_FAST_HASH_TYPES:
-        return key[0]
-    return _CachedHashKey(key)
+    if not kwargs:
+        if len(args) == 1:
+            # int and str hash quickly and can not be confused with
+            # a multi-argument key, so they are used as keys directly
+            type_ = type(args[0])
+            if type_ is int or type_ is str:
+                return args[0]
+        return _CachedHashKey(args)
+    return _CachedHashKey(
+        (
+            *args,
+            *_HASH_KEY_KEYWORD_MARK,
+            *itertools.chain.from_iterable(kwargs.items()),
+        ),
+    )
 
 
 def make_typed_hash_key(
@@ -536,13 +609,30 @@ def make_typed_hash_key(
     Returns:
         Hashable object that caches its hash, only caclulating it once.
     """
-    key = args + tuple(type(v) for v in args)
-    if kwargs:
-        key += _HASH_KEY_KEYWORD_MARK
-        key += tuple(kwargs.keys())
-        key += tuple(kwargs.values())
-        key += tuple(type(v) for v in kwargs.values())
-    return _CachedHashKey(key)
+    if not kwargs:
+        return _CachedHashKey((*args, *map(type, args)))
+    return _CachedHashKey(
+        (
+            *args,
+            *map(type, args),
+            *_HASH_KEY_KEYWORD_MARK,
+            *kwargs.keys(),
+            *kwargs.values(),
+            *map(type, kwargs.values()),
+        ),
+    )
+
+
+class _UnhashableKey:
+    """Stands in for an unhashable key in :class:`SafeDict`."""
+
+    __slots__ = 'key'
+
+    def __init__(
+        self,
+        key: Any,
+    ) -> None:
+        self.key = key
 
 
 class SafeDict(MutableMapping[_K, _V]):
@@ -553,20 +643,30 @@ class SafeDict(MutableMapping[_K, _V]):
     def __init__(
         self,
     ) -> None:
-        self._hashable_cache: Dict[_K, _V] = {}
-        self._unhashable_cache: List[Tuple[_K, _V]] = []
-        self._order: List[Tuple[bool, int]] = []
+        # unhashable keys are stored using a stand-in key, which
+        # lets the underlying dict keep the order of all items.
+        self._items: Dict[Any, _V] = {}
+        self._unhashable_keys: List[_UnhashableKey] = []
+
+    def _find_unhashable(
+        self,
+        key: Any,
+    ) -> Optional[_UnhashableKey]:
+        for unhashable_key in self._unhashable_keys:
+            if unhashable_key.key is key or unhashable_key.key == key:
+                return unhashable_key
+        return None
 
     def __getitem__(
         self,
         key: _K,
     ) -> _V:
         try:
-            return self._hashable_cache[key]
+            return self._items[key]
         except TypeError:
-            for k, v in reversed(self._unhashable_cache):
-                if k == key:
-                    return v
+            unhashable_key = self._find_unhashable(key)
+            if unhashable_key is not None:
+                return self._items[unhashable_key]
         raise KeyError(key)
 
     def __setitem__(
@@ -575,88 +675,45 @@ class SafeDict(MutableMapping[_K, _V]):
         value: _V,
     ) -> None:
         try:
-            prev_len = len(self._hashable_cache)
-            self._hashable_cache[key] = value
-            # keep track of order only if there are unhashable
-            # keys in this container, otherwise the order is
-            # already kept by the underlying dict.
-            if not self._unhashable_cache:
-                return
-            if len(self._hashable_cache) > prev_len:
-                self._order.append((True, prev_len))
+            self._items[key] = value
         except TypeError:
-            if not self._unhashable_cache:
-                self._order = [(True, i) for i in range(len(self._hashable_cache))]
-            for i, (k, _) in enumerate(reversed(self._unhashable_cache), start=1):
-                if k == key:
-                    self._unhashable_cache[-i] = (key, value)
-            else:
-                self._order.append((False, len(self._unhashable_cache)))
-                self._unhashable_cache.append((key, value))
+            unhashable_key = self._find_unhashable(key)
+            if unhashable_key is None:
+                unhashable_key = _UnhashableKey(key)
+                self._unhashable_keys.append(unhashable_key)
+            self._items[unhashable_key] = value
 
     def __delitem__(
         self,
         key: _K,
     ) -> None:
         try:
-            if key in self._hashable_cache:
-                # keep track of order only if there are unhashable
-                # keys in this container, otherwise the order is
-                # already kept by the underlying dict.
-                if self._unhashable_cache:
-                    for key_idx, k in enumerate(self._hashable_cache):
-                        if k == key:
-                            for order_idx, (hashable, idx) in enumerate(self._order):
-                                if hashable and idx == key_idx:
-                                    self._order.pop(order_idx)
-                                    break
-                            break
-                del self._hashable_cache[key]
-                return
+            del self._items[key]
+            return
         except TypeError:
-            for key_idx, (k, _) in enumerate(reversed(self._unhashable_cache), start=1):
-                if k == key:
-                    self._unhashable_cache.pop(-key_idx)
-                    for order_idx, (hashable, idx) in enumerate(self._order):
-                        if not hashable and idx == key_idx:
-                            self._order.pop(order_idx)
-                            break
-                    return
+            unhashable_key = self._find_unhashable(key)
+            if unhashable_key is not None:
+                self._unhashable_keys.remove(unhashable_key)
+                del self._items[unhashable_key]
+                return
         raise KeyError(key)
 
-    def _ordered_iter(
-        self,
-        reverse: bool,
-    ) -> Iterator[_K]:
-        if not self._unhashable_cache:
-            # use order kept by underlying dict
-            if reverse:
-                yield from reversed(self._hashable_cache)
-            else:
-                yield from self._hashable_cache
-            return
-        hashable_keys = tuple(self._hashable_cache)
-        unhashable_keys = tuple(key for key, _ in self._unhashable_cache)
-        for hashable, index in (reversed(self._order) if reverse else self._order):
-            if hashable:
-                yield hashable_keys[index]
-            else:
-                yield unhashable_keys[index]
-
     def __iter__(
         self,
     ) -> Iterator[_K]:
-        yield from self._ordered_iter(reverse=False)
+        for key in self._items:
+            yield key.key if type(key) is _UnhashableKey else key
 
     def __len__(
         self,
     ) -> int:
-        return len(self._hashable_cache) + len(self._unhashable_cache)
+        return len(self._items)
 
     def __reversed__(
         self,
     ) -> Iterator[_K]:
-        yield from self._ordered_iter(reverse=True)
+        for key in reversed(self._items):
+            yield key.key if type(key) is _UnhashableKey else key
 
 
 class ValueCache(Generic[_K, _V]):
@@ -984,7 +1041,10 @@ class IterableFromIterator(Generic[_T]):
     def __bool__(
         self,
     ) -> bool:
-        for _ in self:
+        if self._cache:
+            return True
+        for item in self._iter:
+            self._cache.append(item)
             return True
         return False
 
@@ -1005,6 +1065,13 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
             lower: bool
             higher: bool
 
+        _NO_RELATION: ClassVar[_PriorityRelation] = _PriorityRelation(
+            lower=False,
+            higher=False,
+        )
+
+        __slots__ = ('name', 'ident', 'lower', 'higher', '_bit', '_fingerprint')
+
         name: str
         ident: int
         lower: Set[int]
@@ -1025,6 +1092,12 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
             self.ident = ident
             self.lower = lower
             self.higher = higher
+            # 64 bit masks of the identities, used to rule out
+            # a relation without any set lookups
+            self._bit = 1 << (ident & 63)
+            self._fingerprint = 0
+            for i in lower | higher:
+                self._fingerprint |= 1 << (i & 63)
 
         def __lt__(
             self,
@@ -1044,6 +1117,8 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         ) -> bool:
             if not isinstance(other, PriorityOrder._RelativePriorityContainer):
                 raise TypeError
+            if not (self._bit & other._fingerprint or other._bit & self._fingerprint):
+                return False
             return (
                 other.ident in self.lower
                 or other.ident in self.higher
@@ -1057,6 +1132,8 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         ) -> 'PriorityOrder._RelativePriorityContainer._PriorityRelation':
             if not isinstance(other, PriorityOrder._RelativePriorityContainer):
                 raise TypeError
+            if not (self._bit & other._fingerprint or other._bit & self._fingerprint):
+                return self._NO_RELATION
             lower = (
                 self.ident in other.lower
                 or other.ident in self.higher
@@ -1078,6 +1155,8 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
     class _WrappedValue(Generic[_V]):
         """Wrapes a value, storing it with any contextual information."""
 
+        __slots__ = ('value', 'name', 'ident', 'priority', 'relative_priority', 'index')
+
         value: _V
         """The value to wrap"""
 
@@ -1131,6 +1210,11 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         ) -> Set[int]:
             if priority is None:
                 return set()
+            # skip the slower abc instance check for common input types
+            if type(priority) in (set, frozenset, tuple, list):
+                return set(map(hash, priority))  # type: ignore
+            if type(priority) in (int, str, bytes):
+                return {hash(priority)}
             try:
                 if (
                     isinstance(priority, collections.abc.Iterable)
@@ -1145,6 +1229,7 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         self,
     ) -> None:
         self._values: List[PriorityOrder._WrappedValue[_T]] = []
+        self._index: Dict[_T, PriorityOrder._WrappedValue[_T]] = {}
 
     def __len__(
         self,
@@ -1173,6 +1258,7 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         if isinstance(index, slice):
             new = self.__class__()
             new._values = self._values[index]
+            new._index = {wrapped.value: wrapped for wrapped in new._values}
             return new
         return self._values[index].value
 
@@ -1189,14 +1275,25 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         else:
             removed_values = [self._values[index]]
         del self._values[index]
+        for removed_value in removed_values:
+            del self._index[removed_value.value]
         # If removed value(s) had any relative priority relation
         # with current values recalculate the entire order instead
         # of doing something more fancy
+        removed_idents = set()
+        referenced_idents: Set[int] = set()
+        for removed_value in removed_values:
+            removed_idents.add(removed_value.ident)
+            referenced_idents.update(removed_value.relative_priority.lower)
+            referenced_idents.update(removed_value.relative_priority.higher)
         for value in self._values:
-            for removed_value in removed_values:
-                if value.relative_priority.has_relation(removed_value.relative_priority):
-                    self.reload()
-                    return
+            if (
+                value.ident in referenced_idents
+                or not removed_idents.isdisjoint(value.relative_priority.lower)
+                or not removed_idents.isdisjoint(value.relative_priority.higher)
+            ):
+                self.reload()
+                return
 
     def reload(
         self,
@@ -1204,13 +1301,9 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
         """Reshuffle values in this container based on priority."""
         values = sorted(self._values, key=lambda x: x.index)
         del self._values[:]
+        self._index.clear()
         for value in values:
-            self.add(
-                value=value.value,
-                priority=value.priority,
-                lower_priority=value.relative_priority.lower,
-                higher_priority=value.relative_priority.higher,
-            )
+            self._insert(value)
 
     @overload
     def add(
@@ -1254,33 +1347,38 @@ class PriorityOrder(Sequence[_T], Generic[_T]):
             )
 
             # does the value to be added already exist?
-            for i in range(len(self._values)):
-                if self._values[i] == wrapped:
-                    if replace:
-                        del self._values[i]
-                        break
+            existing = self._index.get(value)
+            if existing is not None:
+                if not replace:
                     raise ValueError(
                         f'{wrapped} already exists.',
                     )
-
-            # find insertion index for value based on priorities.
-            # circular priorities with a length larger than 1 do
-            # not raise an error.
-            idx = 0
-            for i, position in enumerate(self._values):
-                if wrapped.relative_priority > position.relative_priority:
-                    break
-                if (
-                    wrapped.relative_priority < position.relative_priority
-                    or wrapped.priority < position.priority
-                ):
-                    idx = i + 1
-            self._values.insert(idx, wrapped)
+                self._values.remove(existing)
+            self._insert(wrapped)
             return value
         if value is None:
             return wrapper
         return wrapper(value)
 
+    def _insert(
+        self,
+        wrapped: 'PriorityOrder._WrappedValue[_T]',
+    ) -> None:
+        # find insertion index for value based on priorities.
+        # circular priorities with a length larger than 1 do
+        # not raise an error.
+        idx = 0
+        for i, position in enumerate(self._values):
+            relation = wrapped.relative_priority.get_relation(
+                position.relative_priority,
+            )
+            if relation.higher:
+                break
+            if relation.lower or wrapped.priority < position.priority:
+                idx = i + 1
+        self._values.insert(idx, wrapped)
+        self._index[wrapped.value] = wrapped
+
 
 class WeakTypeCache:
     """A type cache that holds its values as weak references.
@@ -1309,14 +1407,12 @@ class WeakTypeCache:
     def __iter__(
         self,
     ) -> Iterator[Any]:
-        data = getattr(self._types, 'data', None)
-        if isinstance(data, dict):
-            for ref in reversed(data):
-                type_ = ref()
-                if type_ is not None:
-                    yield type_
-        else:
-            yield from reversed(tuple(self._types))
+        # keyrefs() is a snapshot, so types being garbage
+        # collected while iterating is not an issue
+        for ref in reversed(self._types.keyrefs()):  # type: ignore
+            type_ = ref()
+            if type_ is not None:
+                yield type_
 
     def __contains__(
         self,
@@ -1337,10 +1433,8 @@ class WeakTypeCache:
             return
         if type_ in self._skip_types:
             return
-        try:
-            del self._types[type_]
-        except KeyError:
-            pass
+        # re-insert to move the type to the end
+        self._types.pop(type_, None)
         self._types[type_] = None
 
     def clear(
@@ -1350,6 +1444,30 @@ class WeakTypeCache:
         self._types.clear()
 
 
+# number of results cached for each of the structural `is_*_type`
+# predicates, which are called repeatedly with the same types.
+_TYPE_PREDICATE_CACHE_SIZE: Final = 1024
+_SEQUENCE_FAST_TYPES: Final = (list, tuple)
+_OBJ_INSTANCE_FAST_TYPES: Final = (
+    int,
+    float,
+    bool,
+    str,
+    bytes,
+    list,
+    tuple,
+    dict,
+    type(None),
+)
+
+# only needed when it differs from `typing.get_origin` (python 3.8)
+_EXTENSIONS_GET_ORIGIN: Final = (
+    None
+    if typing_extensions.get_origin is get_origin
+    else typing_extensions.get_origin
+)
+
+
 def is_missing(
     value: Any,
 ) -> bool:
@@ -1364,7 +1482,10 @@ def is_missing(
     Returns:
         ``True`` if missing, else ``False``.
     """
-    return value in (omegaconf.MISSING, dataclasses.MISSING)
+    return (
+        value is dataclasses.MISSING
+        or isinstance(value, str) and value == omegaconf.MISSING
+    )
 
 
 def is_sequence(
@@ -1378,17 +1499,24 @@ def is_sequence(
     Returns:
         ``True`` if value is a sequence, else ``False``.
     """
+    # fast path for the most common concrete sequences,
+    # avoiding the much slower structural protocol check.
+    if type(value) in _SEQUENCE_FAST_TYPES:
+        return True
+    if isinstance(value, collections.abc.Sequence):
+        return not isinstance(value, (str, bytes))
     try:
         return (
             not is_mapping(value)
             and not isinstance(value, (str, bytes))
-            and isinstance(value, SequenceProtocol)
+            and _implements(value, SequenceProtocol)
             and is_obj_instance(value)
         )
     except TypeError:
         return False
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def is_sequence_type(
     value: Any,
 ) -> TypeGuard[Type[Sequence]]:
@@ -1406,7 +1534,7 @@ def is_sequence_type(
         return (
             not is_mapping_type(value)
             and not issubclass(value, (str, bytes))
-            and isinstance(value, SequenceProtocol)
+            and _implements(value, SequenceProtocol)
             and not is_obj_instance(value)
         )
     except TypeError:
@@ -1451,19 +1579,13 @@ def is_fixed_size_tuple_type(
     Returns:
         ``True`` if value is a a fixed size tuple type, else ``False``.
     """
-    return (
-        (
-            value is tuple
-            or get_origin(value) is tuple
-        )
-        and (
-            (
-                (args := get_args(value))
-                and ... not in args
-            )
-            or is_empty_tuple_type(value)
-        )
-    )
+    # only type aliases can specify contents of tuple, and
+    # a type alias without arguments is considered Tuple[Any, ...]
+    if get_origin(value) is not tuple or value is Tuple:
+        return False
+    args = get_args(value)
+    # no arguments or an empty tuple argument is an empty tuple type
+    return not args or args == ((),) or ... not in args
 
 
 def is_mapping(
@@ -1477,15 +1599,20 @@ def is_mapping(
     Returns:
         ``True`` if value is a mapping, else ``False``.
     """
+    # fast path for the most common concrete mapping,
+    # avoiding the much slower structural protocol check.
+    if type(value) is dict or isinstance(value, collections.abc.Mapping):
+        return True
     try:
         return (
-            isinstance(value, MappingProtocol)
+            _implements(value, MappingProtocol)
             and is_obj_instance(value)
         )
     except TypeError:
         return False
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def is_mapping_type(
     value: Any,
 ) -> TypeGuard[Type[Mapping]]:
@@ -1501,7 +1628,7 @@ def is_mapping_type(
         return is_mapping_type(origin)
     try:
         return (
-            isinstance(value, MappingProtocol)
+            _implements(value, MappingProtocol)
             and not is_obj_instance(value)
         )
     except TypeError:
@@ -1563,6 +1690,7 @@ def is_namedtuple(
     )
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def is_namedtuple_type(
     value: Any,
 ) -> TypeGuard[Type[NamedTupleProtocol]]:
@@ -1574,15 +1702,15 @@ def is_namedtuple_type(
     Returns:
         ``True`` if value is a namedtuple type, else ``False``.
     """
-    try:
-        if not isinstance(value, NamedTupleProtocol):
-            return False
-        for cls in inspect.getmro(value):  # type: ignore
-            if tuple in cls.__bases__:
-                return True
-    except Exception:
-        pass
-    return False
+    # namedtuples are tuple subclasses with the namedtuple specific
+    # attributes, the rest of the protocol is inherited from tuple.
+    return (
+        isinstance(value, type)
+        and issubclass(value, tuple)
+        and value is not tuple
+        and hasattr(value, '_fields')
+        and hasattr(value, '_field_defaults')
+    )
 
 
 def is_typed_namedtuple(
@@ -1605,6 +1733,7 @@ def is_typed_namedtuple(
         return False
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def is_typed_namedtuple_type(
     value: Any,
 ) -> TypeGuard[Type[NamedTupleProtocol]]:
@@ -1625,6 +1754,7 @@ def is_typed_namedtuple_type(
         return False
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def is_typeddict_type(
     value: Any,
 ) -> bool:
@@ -1698,6 +1828,8 @@ def is_obj_instance(
         ``True`` if value is an iinstantiated object,
         else ``False``.
     """
+    if type(value) in _OBJ_INSTANCE_FAST_TYPES:
+        return True
     if is_typing_alias(value):
         return False
     try:
@@ -1717,9 +1849,15 @@ def is_annotated(
     Returns:
         ``True`` if value originates from :data:`typing.Annotated`, else ``False``.
     """
+    # every Annotated alias carries its metadata, which lets the
+    # common case of a non-annotated value skip the origin lookups
+    if not hasattr(value, '__metadata__'):
+        return False
+    if get_origin(value) is Annotated:  # python 3.9+
+        return True
     return (
-        get_origin(value) is Annotated  # python 3.9+
-        or typing_extensions.get_origin(value) is Annotated  # python 3.8
+        _EXTENSIONS_GET_ORIGIN is not None
+        and _EXTENSIONS_GET_ORIGIN(value) is Annotated  # python 3.8
     )
 
 
@@ -1757,10 +1895,9 @@ def is_protocol(
     Returns:
         ``True`` if value is a protocol, else ``False``.
     """
-    for cls in getattr(value, '__bases__', ()):
-        if cls in _ProtocolTypes:
-            return True
-    return False
+    if not isinstance(value, type):
+        return False
+    return not _PROTOCOL_TYPES.isdisjoint(value.__bases__)
 
 
 def is_literal(
@@ -1791,6 +1928,21 @@ def is_literal_string(
     return value in _LiteralStringTypes
 
 
+_GENERIC_ALIAS_TYPE: Final = getattr(types, 'GenericAlias', None)  # python 3.9+
+_TYPING_ALIAS_CLASS_SUFFIXES: Final = (
+    '_GenericAlias',
+    '_SpecialForm',
+    '_AnnotatedAlias',
+)
+
+
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE)
+def _is_typing_alias_class(
+    cls: Any,
+) -> bool:
+    return cls.__name__.endswith(_TYPING_ALIAS_CLASS_SUFFIXES)
+
+
 def is_typing_alias(
     value: Any,
 ) -> bool:
@@ -1810,14 +1962,10 @@ def is_typing_alias(
     """
     return (
         get_origin(value) is not None
-        or type(value) is getattr(types, 'GenericAlias', None)
+        or type(value) is _GENERIC_ALIAS_TYPE
         or value in _TypeAliasTypes
         or hasattr(value, '__class__')
-        and (
-            value.__class__.__name__.endswith('_GenericAlias')
-            or value.__class__.__name__.endswith('_SpecialForm')
-            or value.__class__.__name__.endswith('_AnnotatedAlias')
-        )
+        and _is_typing_alias_class(value.__class__)
     )
 
 
@@ -1833,10 +1981,11 @@ def is_optional(
         ``True`` if value is ``typing.Union`` and
         :data:`None` is in its arguments, else ``False``.
     """
-    if is_annotated(type_):
-        type_ = get_origin(type_)
-    return get_origin(type_) is Union \
-        and type(None) in get_args(type_)
+    origin = get_origin(type_)
+    if origin is Annotated:
+        type_ = get_args(type_)[0]
+        origin = get_origin(type_)
+    return origin is Union and type(None) in get_args(type_)
 
 
 def get_type(
@@ -1859,8 +2008,8 @@ def get_type(
     Returns:
         The type.
     """
-    if (origin := get_origin(value)) is not None:
-        return get_type(origin)
+    while (origin := get_origin(value)) is not None:
+        value = origin
     if is_typing_alias(value):
         return value
     try:
@@ -1890,7 +2039,7 @@ def get_optional_type(
             f'{type_}',
         )
     if is_annotated(type_):
-        type_ = get_origin(type_)
+        type_ = get_args(type_)[0]
     args = []
     for arg in get_args(type_):
         if arg not in (None, type(None)):  # noqa: E721
@@ -1949,8 +2098,11 @@ def base64_to_bytes(
         The bytes representation of the base64 string argument.
     """
     encoded = value.encode('utf-8')
-    padded_value = encoded + b'=' * (4 - len(encoded) % 4)
-    return base64.urlsafe_b64decode(padded_value)
+    # padding may have been stripped when encoding
+    remainder = len(encoded) % 4
+    if remainder:
+        encoded += b'=' * (4 - remainder)
+    return base64.urlsafe_b64decode(encoded)
 
 
 def primitive_to_bool(
@@ -1971,8 +2123,11 @@ def primitive_to_bool(
     Returns:
         The bool representation of the value argument.
     """
-    if isinstance(value, bool):
+    # bool can not be subclassed
+    if type(value) is bool:
         return value
+    if isinstance(value, str):
+        return str_to_bool(value)
     if value == 1:
         return True
     elif value == 0:
@@ -1980,6 +2135,12 @@ def primitive_to_bool(
     return str_to_bool(str(value))
 
 
+_TRUE_STRINGS: Final = frozenset(('1', 'true', 'y', 'yes', 'on'))
+_FALSE_STRINGS: Final = frozenset(('0', 'false', 'n', 'no', 'off'))
+_NONE_STRINGS: Final = frozenset(('null', 'none'))
+_NONE_TYPE: Final = type(None)
+
+
 def str_to_bool(
     value: str,
 ) -> bool:
@@ -2000,9 +2161,10 @@ def str_to_bool(
     Returns:
         The input string parsed as a bool.
     """
-    if value.lower() in ('1', 'true', 'y', 'yes', 'on'):
+    lowered = value.lower()
+    if lowered in _TRUE_STRINGS:
         return True
-    elif value.lower() in ('0', 'false', 'n', 'no', 'off'):
+    elif lowered in _FALSE_STRINGS:
         return False
     raise ValueError(
         'Expected 1 | 0 | [Tt][Rr][Uu][Ee] | '
@@ -2066,6 +2228,18 @@ def float_to_int(
     return int(value)
 
 
+_PRIMITIVE_TYPES: Final = (int, float, bool, str)
+# (target type, value type) -> cast function, used by `cast_primitive`
+_CAST_PRIMITIVE_FUNCS: Final[Dict[Tuple[type, type], Callable[[Any], Any]]] = {
+    **{(bool, type_): primitive_to_bool for type_ in _PRIMITIVE_TYPES},
+    **{(int, type_): int for type_ in _PRIMITIVE_TYPES},
+    (int, str): str_to_int,
+    (int, float): float_to_int,
+    **{(float, type_): float for type_ in _PRIMITIVE_TYPES},
+    **{(str, type_): str for type_ in _PRIMITIVE_TYPES},
+}
+
+
 def cast_primitive(
     type_: Type[_P],
     value: Union[int, float, bool, str],
@@ -2085,6 +2259,10 @@ def cast_primitive(
     Returns:
         The casted value.
     """
+    # exact builtin types are dispatched directly
+    cast_func = _CAST_PRIMITIVE_FUNCS.get((type_, type(value)))
+    if cast_func is not None:
+        return cast_func(value)
     if not issubclass(type_, (int, float, bool, str)):
         raise ValueError(f'only primitive (sub)types are valid: {type_}')
     if not is_primitive(value):
@@ -2134,14 +2312,17 @@ def match_literal(
     Returns:
         The literal that was matched.
     """
+    # the value is only cast once per literal type
+    casted: Dict[type, Any] = {}
     for literal in literals:
-        try:
-            return cast_literal(
-                literal=literal,  # type: ignore
-                value=value,
-            )
-        except ValueError:
-            pass
+        type_ = type(literal)
+        if type_ not in casted:
+            try:
+                casted[type_] = cast_primitive(type_, value)  # type: ignore
+            except ValueError:
+                casted[type_] = _NOT_FOUND
+        if casted[type_] is not _NOT_FOUND and casted[type_] == literal:
+            return literal
     raise ValueError(
         'could not match any of the literals '
         f'{tuple(literals)}: {value}',
@@ -2166,15 +2347,53 @@ def cast_none(
         The casted value.
     """
     if (
-        is_missing(value)
-        or value in (None, type(None))
+        value is None
+        or value is _NONE_TYPE
+        or is_missing(value)
+        or str(value).lower() in _NONE_STRINGS
     ):
         return None
-    if str(value).lower() in ('null', 'none'):
-        return None
     raise ValueError(f'could not cast to `None`: {value}')
 
 
+# number of parsed docstrings and class sources to keep cached
+_DESCRIPTION_CACHE_SIZE: Final = 1024
+
+
+@cache(maxsize=_DESCRIPTION_CACHE_SIZE)
+def _parse_docstring(
+    doc: str,
+) -> docstring_parser.Docstring:
+    return docstring_parser.parse(doc)
+
+
+@cache(maxsize=_DESCRIPTION_CACHE_SIZE)
+def _get_attribute_docstrings(
+    cls,
+) -> Mapping[str, str]:
+    """Get the docstrings placed directly after annotated
+    attributes in the source of a class."""
+    try:
+        ast_body = ast.parse(inspect.getsource(cls)).body[0].body  # type: ignore
+    except Exception:
+        return {}
+    docstrings: Dict[str, str] = {}
+    for node, next_node in zip(ast_body, ast_body[1:]):
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and isinstance(next_node, ast.Expr)
+            and isinstance(next_node.value, ast.Constant)
+            and isinstance(next_node.value.value, str)
+        ):
+            docstrings.setdefault(
+                node.target.id,
+                inspect.cleandoc(next_node.value.value),
+            )
+    return docstrings
+
+
+@cache(maxsize=_DESCRIPTION_CACHE_SIZE)
 def extract_description(
     doc: str,
 ) -> str:
@@ -2193,7 +2412,7 @@ def extract_description(
     if not doc:
         return description
     try:
-        parsed = docstring_parser.parse(doc)
+        parsed = _parse_docstring(doc)
         try:
             if parsed.short_description:
                 description = parsed.short_description
@@ -2239,7 +2458,7 @@ def _get_attribute_description(
     doc = getattr(cls, '__doc__', None)
     if doc:
         try:
-            for param in docstring_parser.parse(doc).params:
+            for param in _parse_docstring(doc).params:
                 try:
                     if param.arg_name == name and param.description:
                         return param.description
@@ -2247,32 +2466,7 @@ def _get_attribute_description(
                     pass
         except Exception:
             pass
-    try:
-        ast_body = ast.parse(inspect.getsource(cls)).body[0].body  # type: ignore
-    except Exception:
-        return None
-    node_iter = iter(ast_body)
-    while True:
-        try:
-            node = next(node_iter)
-        except StopIteration:
-            break
-        if (
-            isinstance(node, ast.AnnAssign)
-            and isinstance(node.target, ast.Name)
-            and node.target.id == name
-        ):
-            try:
-                node = next(node_iter)
-                if not isinstance(node, ast.Expr):
-                    continue
-                if isinstance(node.value, ast.Constant):
-                    if isinstance(node.value.value, str):
-                        return inspect.cleandoc(node.value.value)
-            except StopIteration:
-                pass
-            break
-    return None
+    return _get_attribute_docstrings(cls).get(name)
 
 
 def get_attribute_description(
@@ -2291,8 +2485,8 @@ def get_attribute_description(
         The attribute description if found, else :data:`None`.
     """
     try:
-        for base in inspect.getmro(cls):
-            if base == object:
+        for base in cls.__mro__:
+            if base is object:
                 continue
             descr = _get_attribute_description(
                 base,
@@ -2337,6 +2531,10 @@ def as_dataclass(
     return dataclasses.dataclass(cls)
 
 
+# minimum similarity ratio for a candidate to be considered close
+_CLOSEST_CUTOFF: Final = 0.6
+
+
 def get_closest(
     value: str,
     candidates: Iterable[str],
@@ -2352,14 +2550,27 @@ def get_closest(
     Returns:
         The closest candidate. :data:`None` if no candidate is close.
     """
-    close = difflib.get_close_matches(
-        value,
-        candidates,
-        n=1,
-    )
-    if close:
-        return close[0]
-    return None
+    # same selection as difflib.get_close_matches(value, candidates, n=1)
+    # but with a single matcher and a cutoff raised to the best ratio
+    # so that candidates are pruned by the cheap upper bounds
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(value)
+    cutoff = _CLOSEST_CUTOFF
+    best: Optional[Tuple[float, str]] = None
+    for candidate in candidates:
+        matcher.set_seq1(candidate)
+        if (
+            matcher.real_quick_ratio() < cutoff
+            or matcher.quick_ratio() < cutoff
+        ):
+            continue
+        ratio = matcher.ratio()
+        if ratio >= cutoff and (best is None or (ratio, candidate) > best):
+            best = (ratio, candidate)
+            cutoff = ratio
+    if best is None:
+        return None
+    return best[1]
 
 
 def get_closest_error_message(
@@ -2393,6 +2604,7 @@ def get_closest_error_message(
     return message
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def inspect_sequence_type(
     sequence_type: Any,
 ) -> Any:
@@ -2424,16 +2636,17 @@ def inspect_sequence_type(
         '__orig_bases__',
         (),
     )
-    for base in (sequence_type,) + orig_bases:
+    for base in itertools.chain((sequence_type,), orig_bases):
         if is_sequence_type(base):
             t_args = get_args(base)
-            if (
-                len(t_args) == 1
-                or len(t_args) == 2 and ... in t_args
-            ):
-                for t in t_args:
-                    if t != ...:
-                        return t
+            if len(t_args) == 1:
+                if t_args[0] is not ...:
+                    return t_args[0]
+            elif len(t_args) == 2:
+                if t_args[1] is ...:
+                    return t_args[0]
+                if t_args[0] is ...:
+                    return t_args[1]
     return Any
 
 
@@ -2442,6 +2655,7 @@ class _MappingKeyValueTypesInfo(NamedTuple):
     value: Any
 
 
+@cache(maxsize=_TYPE_PREDICATE_CACHE_SIZE, typed=True)
 def inspect_mapping_type(
     mapping_type: Any,
 ) -> _MappingKeyValueTypesInfo:
@@ -2464,16 +2678,17 @@ def inspect_mapping_type(
     """
     if is_annotated(mapping_type):
         mapping_type = get_origin(mapping_type)
-    orig_bases = getattr(
-        mapping_type,
-        '__orig_bases__',
-        getattr(
-            get_type(mapping_type),
-            '__orig_bases__',
-            (),
-        ),
-    )
-    for base in (mapping_type, get_type(mapping_type)) + orig_bases:
+    if is_mapping_type(mapping_type):
+        t_args = get_args(mapping_type)
+        if len(t_args) == 2:
+            # parameterized mapping, no need to look at its bases
+            return _MappingKeyValueTypesInfo(t_args[0], t_args[1])
+    origin_type = get_type(mapping_type)
+    if hasattr(mapping_type, '__orig_bases__'):
+        orig_bases = mapping_type.__orig_bases__
+    else:
+        orig_bases = getattr(origin_type, '__orig_bases__', ())
+    for base in itertools.chain((origin_type,), orig_bases):
         if is_mapping_type(base):
             t_args = get_args(base)
             if len(t_args) == 2:
@@ -2484,8 +2699,8 @@ def inspect_mapping_type(
 def is_testing() -> bool:
     """Discover if the current runtime is for testing with Pytest."""
     return (
-        'PYTEST_CURRENT_TEST' in os.environ
-        or 'pytest' in sys.modules
+        'pytest' in sys.modules
+        or 'PYTEST_CURRENT_TEST' in os.environ
     )
 
 
@@ -0,0 +1,57 @@
+from typing import (
+    Any,
+    List,
+    Type,
+)
+
+import marsh
+
+
+def _recording_schema(
+    name: str,
+    calls: List[str],
+    matches: bool,
+) -> Type[marsh.schema.core.base.Schema]:
+
+    class RecordingSchema(marsh.schema.core.base.Schema):
+
+        @classmethod
+        def match(
+            cls,
+            value: Any,
+        ) -> bool:
+            calls.append(name)
+            return matches
+
+    RecordingSchema.__name__ = name
+    return RecordingSchema
+
+
+def test_registry_origin() -> None:
+    calls: List[str] = []
+    registry: marsh.schema.core.base.SchemaRegistry = \
+        marsh.schema.core.base.SchemaRegistry()
+    before = _recording_schema('before', calls, matches=False)
+    list_only = _recording_schema('list_only', calls, matches=True)
+    fallback = _recording_schema('fallback', calls, matches=True)
+    registry.register(before, priority=1)
+    registry.register(list_only, origin=list)
+    registry.register(fallback, priority=-1)
+
+    # never asked to match values with another origin
+    assert list(registry.match(int)) == [fallback]
+    assert calls == ['before', 'fallback']
+    assert list_only not in registry.candidates(int)
+
+    # still tried in priority order for values with the origin
+    calls.clear()
+    assert list(registry.match(List[int])) == [list_only]
+    assert calls == ['before', 'list_only']
+    assert tuple(registry.candidates(List[int])) == (before, list_only, fallback)
+
+    # replacing without an origin lifts the restriction
+    registry.register(list_only, replace=True)
+    assert list_only not in registry.origins
+    calls.clear()
+    assert list(registry.match(int)) == [list_only]
+    assert calls == ['before', 'list_only']
@@ -1,3 +1,4 @@
+import itertools
 import typing
 import typing_extensions
 from typing import (
@@ -38,8 +39,8 @@ class PreAnnotation(marsh.annotation.PreAnnotation):
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     Annotated[int, None, None],
@@ -149,7 +150,6 @@ class PreAnnotation(marsh.annotation.PreAnnotation):
             )
             for Annotated in _AnnotatedTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_succeeds(
@@ -166,8 +166,8 @@ def test_unmarshal_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,exception',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     Annotated[int, None, None],
@@ -282,7 +282,6 @@ def test_unmarshal_succeeds(
             )
             for Annotated in _AnnotatedTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_fails(
@@ -1,4 +1,5 @@
 import collections
+import itertools
 import numbers
 import sys
 import typing
@@ -22,7 +23,7 @@ _DynamicDefaultDictTypes: List[Any] = [
     typing.DefaultDict,
 ]
 
-if sys.version_info.minor > 8:
+if sys.version_info >= (3, 9):
     _DynamicDefaultDictTypes = _StaticDefaultDictTypes
 
 
@@ -75,8 +76,8 @@ def test_unmarshal_static_type_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,value,default_factory',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     d[str, Any],
@@ -110,7 +111,6 @@ def test_unmarshal_static_type_succeeds(
                 ),
             ) for d in _DynamicDefaultDictTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_type_succeeds(
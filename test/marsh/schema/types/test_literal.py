@@ -46,7 +46,7 @@ def test_marshal_succeeds(
         # and pytest converts Literal[False] -> Literal[0]
         (
             (Literal[False], 'false', False),
-        ) if sys.version_info.minor > 8 else ()
+        ) if sys.version_info >= (3, 9) else ()
     ),
 )
 def test_unmarshal_succeeds(
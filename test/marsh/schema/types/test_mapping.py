@@ -1,4 +1,5 @@
 import collections.abc
+import itertools
 import sys
 import typing
 from typing import (
@@ -27,7 +28,7 @@ _DynamicMappingTypes: List[Any] = [
     typing.MutableMapping,
 ]
 
-if sys.version_info.minor > 8:
+if sys.version_info >= (3, 9):
     _DynamicMappingTypes = _StaticMappingTypes
 
 
@@ -85,8 +86,8 @@ def test_unmarshal_static_type_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     d[str, Any],
@@ -105,7 +106,6 @@ def test_unmarshal_static_type_succeeds(
                 ),
             ) for d in _DynamicMappingTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_type_succeeds(
@@ -152,8 +152,8 @@ def test_unmarshal_static_type_fails(
 
 @pytest.mark.parametrize(
     'type_,element,exception',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     d[int, Any],
@@ -162,7 +162,6 @@ def test_unmarshal_static_type_fails(
                 ),
             ) for d in _DynamicMappingTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_type_fails(
@@ -1,3 +1,4 @@
+import itertools
 import typing
 import typing_extensions
 from typing import (
@@ -76,8 +77,8 @@ def test_marshal_succeeds(
         (bool, 'n', False),
         (bool, 'no', False),
         (bool, 'off', False),
-    ) + sum(
-        (
+    ) + tuple(
+        itertools.chain.from_iterable(
             (
                 (LiteralString, '', ''),
                 (LiteralString, 0, '0'),
@@ -85,7 +86,6 @@ def test_marshal_succeeds(
                 (LiteralString, True, 'True'),
             ) for LiteralString in _LiteralStringTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_succeeds(
@@ -118,15 +118,14 @@ def test_unmarshal_succeeds(
         (float, marsh.MISSING, marsh.errors.MissingValueError),
         (bool, marsh.MISSING, marsh.errors.MissingValueError),
         (str, marsh.MISSING, marsh.errors.MissingValueError),
-    ) + sum(
-        (
+    ) + tuple(
+        itertools.chain.from_iterable(
             (
                 (LiteralString, (), None),
                 (LiteralString, {}, None),
                 (LiteralString, marsh.MISSING, marsh.errors.MissingValueError),
             ) for LiteralString in _LiteralStringTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_fails(
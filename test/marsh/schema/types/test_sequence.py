@@ -1,4 +1,5 @@
 import collections.abc
+import itertools
 import sys
 import typing
 from typing import (
@@ -38,7 +39,7 @@ _DynamicMutableSequenceTypes: List[Any] = [
     typing.MutableSequence,
 ]
 
-if sys.version_info.minor > 8:
+if sys.version_info >= (3, 9):
     _DynamicTupleTypes = _StaticTupleTypes
     _DynamicSequenceTypes = _StaticSequenceTypes
     _DynamicMutableSequenceTypes = _StaticMutableSequenceTypes
@@ -110,8 +111,8 @@ def test_unmarshal_static_mutable_sequence_type_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (t[Any, ...], (), ()),
                 (t[Any, ...], marsh.MISSING, ()),
@@ -121,7 +122,6 @@ def test_unmarshal_static_mutable_sequence_type_succeeds(
                 (t[t[int, ...], ...], (('0', 1.), (2,)), ((0, 1), (2,))),
             ) for t in _DynamicTupleTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_tuple_type_succeeds(
@@ -138,8 +138,8 @@ def test_unmarshal_dynamic_tuple_type_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (s[Any], (), ()),
                 (s[Any], marsh.MISSING, ()),
@@ -149,7 +149,6 @@ def test_unmarshal_dynamic_tuple_type_succeeds(
                 (s[s[int]], (('0', 1.), (2,)), ((0, 1), (2,))),
             ) for s in _DynamicSequenceTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_sequence_type_succeeds(
@@ -166,8 +165,8 @@ def test_unmarshal_dynamic_sequence_type_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (s[Any], (), []),
                 (s[Any], marsh.MISSING, []),
@@ -177,7 +176,6 @@ def test_unmarshal_dynamic_sequence_type_succeeds(
                 (s[s[int]], (('0', 1.), (2,)), [[0, 1], [2]]),
             ) for s in _DynamicMutableSequenceTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_mutable_sequence_type_succeeds(
@@ -218,14 +216,13 @@ def test_unmarshal_static_sequence_type_fails(
 
 @pytest.mark.parametrize(
     'type_,element,exception',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (t[int, ...], ('a',), None),
                 (t[int, ...], (marsh.MISSING,), None),
             ) for t in _DynamicTupleTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_tuple_type_fails(
@@ -242,8 +239,8 @@ def test_unmarshal_dynamic_tuple_type_fails(
 
 @pytest.mark.parametrize(
     'type_,element,exception',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (s[int], ('a',), None),
                 (s[int], (marsh.MISSING,), None),
@@ -252,7 +249,6 @@ def test_unmarshal_dynamic_tuple_type_fails(
                 + _DynamicMutableSequenceTypes
             )
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_type_fails(
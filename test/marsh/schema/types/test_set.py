@@ -1,3 +1,4 @@
+import itertools
 import sys
 import typing
 from typing import (
@@ -23,7 +24,7 @@ _DynamicSetTypes: List[Any] = [
     typing.Set,
 ]
 
-if sys.version_info.minor > 8:
+if sys.version_info >= (3, 9):
     _DynamicSetTypes = _StaticSetTypes
 
 
@@ -78,8 +79,8 @@ def test_unmarshal_static_type_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     s[Any],
@@ -113,7 +114,6 @@ def test_unmarshal_static_type_succeeds(
                 ),
             ) for s in _DynamicSetTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_type_succeeds(
@@ -164,8 +164,8 @@ def test_unmarshal_static_type_fails(
 
 @pytest.mark.parametrize(
     'type_,element,exception',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     s[int],
@@ -179,7 +179,6 @@ def test_unmarshal_static_type_fails(
                 ),
             ) for s in _DynamicSetTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_dynamic_type_fails(
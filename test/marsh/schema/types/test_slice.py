@@ -94,6 +94,9 @@ def test_unmarshal_succeeds(
         (slice, '0', None),
         (slice, (1, 2, 3, 4), None),
         (slice, {'a': 1}, None),
+        (slice, ('a',), None),
+        (slice, (1, [2]), None),
+        (slice, dict(start=1.5), None),
     ),
 )
 def test_unmarshal_fails(
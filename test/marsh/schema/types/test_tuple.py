@@ -1,3 +1,4 @@
+import itertools
 import sys
 import typing
 from typing import (
@@ -16,14 +17,14 @@ _TupleTypes: List[Any] = [
     typing.Tuple,
 ]
 
-if sys.version_info.minor > 8:
+if sys.version_info >= (3, 9):
     _TupleTypes.append(tuple)
 
 
 @pytest.mark.parametrize(
     'type_,element,value',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (
                     t[int, float, str, bool],
@@ -36,7 +37,6 @@ if sys.version_info.minor > 8:
                 (t[()], (), ()),
             ) for t in _TupleTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_succeeds(
@@ -53,8 +53,8 @@ def test_unmarshal_succeeds(
 
 @pytest.mark.parametrize(
     'type_,element,exception',
-    sum(
-        (
+    tuple(
+        itertools.chain.from_iterable(
             (
                 (t[()], (3,), None),
                 (t[int], ('3', 4), None),
@@ -65,7 +65,6 @@ def test_unmarshal_succeeds(
                 (t[int, str], (marsh.MISSING, 4), marsh.errors.MissingValueError),
             ) for t in _TupleTypes
         ),
-        (),
     ),
 )
 def test_unmarshal_fails(
@@ -6,6 +6,7 @@ from typing import (
 )
 
 import pytest
+import typing_extensions
 
 import marsh.testing
 
@@ -20,13 +21,22 @@ class B(TypedDict, total=False):
     b: str
 
 
+class C(typing_extensions.TypedDict):
+    a: int
+    b: typing_extensions.NotRequired[str]
+    c: float
+
+
 @pytest.mark.parametrize(
     'type_,element,value',
     (
         (A, dict(a=1, b='test'), A(a=1, b='test')),
         (A, (1, 'test'), A(a=1, b='test')),
         (B, dict(a=1), B(a=1)),
+        (B, (1,), B(a=1)),
         (B, marsh.MISSING, B()),
+        (C, (1, 2.0, 'z'), C(a=1, c=2.0, b='z')),
+        (C, (1, 2.0), C(a=1, c=2.0)),
     ),
 )
 def test_unmarshal_succeeds(
@@ -54,6 +64,8 @@ def test_unmarshal_succeeds(
         (A, None, None),
         (A, dict(a=1, c=3), None),
         (B, dict(c=3), None),
+        (C, (1, 'z', 2.0), None),
+        (C, (1,), None),
     ),
 )
 def test_unmarshal_fails(
@@ -22,6 +22,8 @@ import marsh.testing
         (Union[List[str], str], 'abc', 'abc'),
         (Union[str, List[str]], ('abc',), ['abc']),
         (Optional[int], marsh.MISSING, None),
+        (Union[None, int], '0', 0),
+        (Union[int, None, List[int]], ('0',), [0]),
     ),
 )
 def test_unmarshal_succeeds(
@@ -41,6 +43,7 @@ def test_unmarshal_succeeds(
     (
         (Union[str, int], marsh.MISSING, marsh.errors.MissingValueError),
         (Union[bool, int], 'abc', None),
+        (Optional[int], ('0',), None),
     ),
 )
 def test_unmarshal_fails(
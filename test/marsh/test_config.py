@@ -7,11 +7,11 @@ import yaml
 import marsh
 
 
-@pytest.fixture(scope='function')
+@pytest.fixture(scope='module')
 def config_dir(
-    tmp_path,
+    tmp_path_factory,
 ) -> str:
-    dpath = str(tmp_path.absolute())
+    dpath = str(tmp_path_factory.mktemp('config').absolute())
 
     def dump(
         path,
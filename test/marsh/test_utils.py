@@ -1,13 +1,17 @@
 import collections.abc
 import dataclasses
+import difflib
+import typing_extensions
 from typing import (
     Any,
     Dict,
     List,
     Mapping,
     NamedTuple,
+    Optional,
     Sequence,
     Tuple,
+    Union,
 )
 
 import pytest
@@ -23,6 +27,67 @@ class TypingNamedTuple(NamedTuple):
     a: int = 0
 
 
+class DuckSequence:
+    """Has the sequence protocol members without
+    subclassing :class:`collections.abc.Sequence`."""
+
+    def __contains__(self, value) -> bool:
+        return False
+
+    def __getitem__(self, index) -> Any:
+        raise IndexError
+
+    def __len__(self) -> int:
+        return 0
+
+
+class BlockedDuckSequence(DuckSequence):
+    __len__ = None  # type: ignore
+
+
+class DynamicDuckSequence:
+    """Provides the sequence protocol members through ``__getattr__``."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ('__contains__', '__getitem__', '__len__'):
+            return lambda *args: None
+        raise AttributeError(name)
+
+
+class PropertyDuckSequence(DuckSequence):
+    """Provides a sequence protocol member through a property."""
+
+    @property  # type: ignore
+    def __len__(self) -> Any:
+        return lambda: 0
+
+
+class DuckMapping:
+    """Has the mapping protocol members without
+    subclassing :class:`collections.abc.Mapping`."""
+
+    def __contains__(self, key) -> bool:
+        return False
+
+    def __getitem__(self, key) -> Any:
+        raise KeyError(key)
+
+    def __iter__(self) -> Any:
+        return iter(())
+
+    def get(self, key, default=None) -> Any:
+        return default
+
+    def items(self) -> Any:
+        return ()
+
+    def keys(self) -> Any:
+        return ()
+
+    def values(self) -> Any:
+        return ()
+
+
 @pytest.mark.parametrize(
     'value,is_missing',
     (
@@ -131,6 +196,8 @@ def test_get_type(
         (BaseNamedTuple(), False),
         (TypingNamedTuple, False),
         (TypingNamedTuple(), False),
+        (DuckMapping, False),
+        (DuckMapping(), True),
     ),
 )
 def test_is_mapping(
@@ -140,6 +207,34 @@ def test_is_mapping(
     assert marsh.utils.is_mapping(value) == is_mapping
 
 
+@pytest.mark.parametrize(
+    'protocol',
+    (
+        marsh.utils.SequenceProtocol,
+        marsh.utils.MappingProtocol,
+    ),
+)
+@pytest.mark.parametrize(
+    'value',
+    (
+        0,
+        [],
+        {},
+        DuckSequence(),
+        BlockedDuckSequence(),
+        DynamicDuckSequence(),
+        PropertyDuckSequence(),
+        DuckMapping(),
+        DuckMapping,
+    ),
+)
+def test_implements_protocol(
+    value: Any,
+    protocol: Any,
+) -> None:
+    assert marsh.utils._implements(value, protocol) == isinstance(value, protocol)
+
+
 @pytest.mark.parametrize(
     'value,is_mapping_type',
     (
@@ -163,6 +258,8 @@ def test_is_mapping(
         (BaseNamedTuple(), False),
         (TypingNamedTuple, False),
         (TypingNamedTuple(), False),
+        (DuckMapping, True),
+        (DuckMapping(), False),
     ),
 )
 def test_is_mapping_type(
@@ -200,6 +297,10 @@ def test_is_mapping_type(
         (BaseNamedTuple(), True),
         (TypingNamedTuple, False),
         (TypingNamedTuple(), True),
+        (DuckSequence, False),
+        (DuckSequence(), True),
+        (BlockedDuckSequence(), False),
+        (DuckMapping(), False),
     ),
 )
 def test_is_sequence(
@@ -237,6 +338,10 @@ def test_is_sequence(
         (BaseNamedTuple(), False),
         (TypingNamedTuple, True),
         (TypingNamedTuple(), False),
+        (DuckSequence, True),
+        (DuckSequence(), False),
+        (BlockedDuckSequence, False),
+        (DuckMapping, False),
     ),
 )
 def test_is_sequence_type(
@@ -394,6 +499,59 @@ def test_is_typed_namedtuple_type(
     assert marsh.utils.is_typed_namedtuple_type(value) == is_typed_namedtuple_type
 
 
+@pytest.mark.parametrize(
+    'value,is_optional',
+    (
+        (int, False),
+        (None, False),
+        (Optional[int], True),
+        (Union[int, str], False),
+        (Union[int, str, None], True),
+        (typing_extensions.Annotated[int, None], False),
+        (typing_extensions.Annotated[Optional[int], None], True),
+    ),
+)
+def test_is_optional(
+    value: Any,
+    is_optional: bool,
+) -> None:
+    assert marsh.utils.is_optional(value) == is_optional
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    (
+        (Optional[int], int),
+        (Union[int, str, None], Union[int, str]),
+        (typing_extensions.Annotated[Optional[int], 1], int),
+        (
+            typing_extensions.Annotated[Optional[Union[int, str]], 1],
+            Union[int, str],
+        ),
+    ),
+)
+def test_get_optional_type(
+    value: Any,
+    expected: Any,
+) -> None:
+    assert marsh.utils.get_optional_type(value) == expected
+
+
+@pytest.mark.parametrize(
+    'value',
+    (
+        int,
+        Union[int, str],
+        typing_extensions.Annotated[int, 1],
+    ),
+)
+def test_get_optional_type_fails(
+    value: Any,
+) -> None:
+    with pytest.raises(ValueError):
+        marsh.utils.get_optional_type(value)
+
+
 class DescrInMainDocstring:
     """Initial docstring
 
@@ -464,3 +622,151 @@ def test_get_attribute_description(
 ) -> None:
     fetched_descr = marsh.utils.get_attribute_description(cls, 'a')
     assert fetched_descr == descr
+
+
+@pytest.mark.parametrize(
+    'args,kwargs,other_args,other_kwargs,equal',
+    (
+        ((0,), {}, (0,), {}, True),
+        (('a',), {}, ('a',), {}, True),
+        ((0, 'a'), {}, (0, 'a'), {}, True),
+        ((), dict(a=0), (), dict(a=0), True),
+        ((0,), dict(a=0), (0,), dict(a=0), True),
+        ((-1,), {}, (-2,), {}, False),
+        (((-1,),), {}, ((-2,),), {}, False),
+        ((0,), {}, (0, 0), {}, False),
+        ((0,), {}, ((0,),), {}, False),
+        ((), dict(a=0), ('a', 0), {}, False),
+        ((), dict(a=0), (), dict(a=1), False),
+    ),
+)
+def test_make_hash_key(
+    args: tuple,
+    kwargs: dict,
+    other_args: tuple,
+    other_kwargs: dict,
+    equal: bool,
+) -> None:
+    key = marsh.utils.make_hash_key(*args, **kwargs)
+    other_key = marsh.utils.make_hash_key(*other_args, **other_kwargs)
+    assert (key == other_key) == equal
+    if equal:
+        assert hash(key) == hash(other_key)
+
+
+def test_safe_dict() -> None:
+    safe_dict: marsh.utils.SafeDict = marsh.utils.SafeDict()
+    safe_dict[0] = 'a'
+    safe_dict[[1]] = 'b'
+    safe_dict[2] = 'c'
+    safe_dict[{3: 3}] = 'd'
+    safe_dict[[1]] = 'e'
+    assert list(safe_dict.items()) == [(0, 'a'), ([1], 'e'), (2, 'c'), ({3: 3}, 'd')]
+    assert list(reversed(safe_dict)) == [{3: 3}, 2, [1], 0]
+    del safe_dict[0]
+    del safe_dict[[1]]
+    assert list(safe_dict.items()) == [(2, 'c'), ({3: 3}, 'd')]
+    assert len(safe_dict) == 2
+    with pytest.raises(KeyError):
+        safe_dict[[1]]
+    with pytest.raises(KeyError):
+        del safe_dict[0]
+
+
+def test_priority_order_add_existing() -> None:
+    order: marsh.utils.PriorityOrder = marsh.utils.PriorityOrder()
+    order.add('a')
+    order.add('b', priority=1)
+    with pytest.raises(ValueError):
+        order.add('a')
+    order.add('a', priority=2, replace=True)
+    assert list(order) == ['a', 'b']
+    del order[0]
+    order.add('a')
+    assert list(order) == ['b', 'a']
+
+
+class LargeHash(str):
+
+    def __hash__(
+        self,
+    ) -> int:
+        # larger than the modulus used when hashing ints
+        return 2 ** 62 + len(self)
+
+
+def test_priority_order_reload() -> None:
+    a, b, c = LargeHash('a'), LargeHash('bb'), LargeHash('ccc')
+    order: marsh.utils.PriorityOrder = marsh.utils.PriorityOrder()
+    order.add('first', priority=1)
+    order.add(a)
+    order.add(b, higher_priority=a)
+    order.add(c, lower_priority=a)
+    assert list(order) == ['first', c, a, b]
+    # removing a value with a relation reloads the entire order
+    del order[0]
+    order.add('first', priority=1, lower_priority=a)
+    del order[order.index('first')]
+    assert list(order) == [c, a, b]
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    (
+        ('', b''),
+        ('YQ', b'a'),
+        ('YQ==', b'a'),
+        ('YWI', b'ab'),
+        ('YWJj', b'abc'),
+        ('_-8', b'\xff\xef'),
+    ),
+)
+def test_base64_to_bytes(
+    value: str,
+    expected: bytes,
+) -> None:
+    assert marsh.utils.base64_to_bytes(value) == expected
+
+
+@pytest.mark.parametrize(
+    'value,candidates',
+    (
+        ('abc', ()),
+        ('abc', ('xyz',)),
+        ('abc', ('abd', 'abc', 'ab')),
+        ('abc', ('abd', 'abe')),
+        ('name', ('names', 'nam', 'value')),
+        ('', ('', 'a')),
+    ),
+)
+def test_get_closest(
+    value: str,
+    candidates: Sequence[str],
+) -> None:
+    expected = difflib.get_close_matches(value, candidates, n=1)
+    assert marsh.utils.get_closest(value, candidates) == (
+        expected[0] if expected else None
+    )
+
+
+class IntList(List[int]):
+    pass
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    (
+        (List[int], int),
+        (Sequence[str], str),
+        (Tuple[str, ...], str),
+        (Tuple[str, int, float], Any),
+        (Tuple[str, int], Any),
+        (list, Any),
+        (IntList, int),
+    ),
+)
+def test_inspect_sequence_type(
+    value: Any,
+    expected: Any,
+) -> None:
+    assert marsh.utils.inspect_sequence_type(value) == expected
@@ -4,17 +4,18 @@ import sys
 from typing import Optional
 
 
+_VERSION_PATTERN = re.compile(r'__version__\s*=\s*[\'"]([^\'"]+)[\'"]')
+
+
 def find_version(
     fpath: str,
 ) -> Optional[str]:
     with open(fpath, 'r') as fp:
-        match = re.search(
-            r'(?<=__version__ = [\'"])([^\'"]+)(?=[\'"])',
-            fp.read(),
-        )
-    if not match:
-        return None
-    return match.group(1)
+        for line in fp:
+            match = _VERSION_PATTERN.search(line)
+            if match:
+                return match.group(1)
+    return None
 
 
 def main() -> None:
@@ -13,18 +13,25 @@ def lint(
     filenames: Iterable[str],
 ) -> int:
     argv = ['--py36-plus']
-    relpaths = []
     cwd = os.getcwd()
+    # the separator keeps sibling directories sharing the
+    # same name prefix (e.g. "/repo-other") from passing
+    cwd_prefix = os.path.join(cwd, '')
+    relpaths = []
     for fpath in filenames:
         abspath = os.path.abspath(fpath)
-        if not abspath.startswith(cwd):
+        if not abspath.startswith(cwd_prefix):
             print('can only lint files under the current working directory')
             sys.exit(1)
         relpaths.append(os.path.relpath(abspath, cwd))
     with tempfile.TemporaryDirectory() as tempdir:
-        for fpath in relpaths:
-            argv.append(os.path.join(tempdir, fpath))
-        shutil.copytree(cwd, tempdir, dirs_exist_ok=True)
+        # only copy the files being linted, and never hardlink them
+        # as add-trailing-comma rewrites its input files in place
+        for fpath in dict.fromkeys(relpaths):
+            temppath = os.path.join(tempdir, fpath)
+            os.makedirs(os.path.dirname(temppath), exist_ok=True)
+            shutil.copyfile(os.path.join(cwd, fpath), temppath)
+            argv.append(temppath)
         return _main.main(argv)
 
 